@@ -15,12 +15,16 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import ctypes
 from ctypes import wintypes
-import threading
-import time
 import re
 import os
+import queue
+import threading
+import urllib.parse
+import urllib.request
+from array import array
 from datetime import datetime
 
 # Try to import PIL for screenshots
@@ -37,17 +41,399 @@ SW_SHOW = 5
 SW_HIDE = 0
 GW_HWNDNEXT = 2
 WM_CLOSE = 0x0010
-PROCESS_QUERY_INFORMATION = 0x0400
-PROCESS_VM_READ = 0x0010
-
-# Load Windows DLLs
-user32 = ctypes.windll.user32
-kernel32 = ctypes.windll.kernel32
-psapi = ctypes.windll.psapi
+WM_DISPLAYCHANGE = 0x007E
+HWND_TOP = 0
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOACTIVATE = 0x0010
+SWP_SHOWWINDOW = 0x0040
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_CONTROL = 0x11
+VK_T = 0x54  # T key for new tab
+VK_RETURN = 0x0D
+NEW_TAB_DELAY_MS = 150
+TITLE_CACHE_SIZE = 1024
+MAX_REFRESH_INTERVAL = 30  # seconds - ceiling for the idle back-off
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+GWLP_WNDPROC = -4
+HSHELL_WINDOWCREATED = 1
+HSHELL_WINDOWDESTROYED = 2
+HSHELL_REDRAW = 6
+SystemProcessInformation = 5
+ProcessCommandLineInformation = 60
+STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+GA_ROOTOWNER = 3
+DWMWA_CLOAKED = 14
+DWM_CLOAKED_SHELL = 0x2  # cloaked by the shell, e.g. on another virtual desktop
+
+# Load Windows DLLs - private instances, so the prototypes below don't
+# clash with anything else sharing ctypes.windll, and the Win32 error
+# code is captured for ctypes.get_last_error()
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+ntdll = ctypes.WinDLL("ntdll")
+try:
+    dwmapi = ctypes.WinDLL("dwmapi")
+except OSError:
+    dwmapi = None
+
+# Function prototypes - declared once so ctypes converts arguments directly
+# instead of guessing per call, and handles aren't truncated to a 32-bit int
+user32.IsWindowVisible.argtypes = [wintypes.HWND]
+user32.IsWindowVisible.restype = wintypes.BOOL
+user32.IsWindow.argtypes = [wintypes.HWND]
+user32.IsWindow.restype = wintypes.BOOL
+user32.IsIconic.argtypes = [wintypes.HWND]
+user32.IsIconic.restype = wintypes.BOOL
+user32.IsZoomed.argtypes = [wintypes.HWND]
+user32.IsZoomed.restype = wintypes.BOOL
+user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetWindowTextW.restype = ctypes.c_int
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, wintypes.LPDWORD]
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.ShowWindow.restype = wintypes.BOOL
+user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+user32.SetForegroundWindow.restype = wintypes.BOOL
+user32.GetForegroundWindow.argtypes = []
+user32.GetForegroundWindow.restype = wintypes.HWND
+user32.PostMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.PostMessageW.restype = wintypes.BOOL
+user32.MoveWindow.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.BOOL]
+user32.MoveWindow.restype = wintypes.BOOL
+user32.GetSystemMetrics.argtypes = [ctypes.c_int]
+user32.GetSystemMetrics.restype = ctypes.c_int
+user32.BeginDeferWindowPos.argtypes = [ctypes.c_int]
+user32.BeginDeferWindowPos.restype = wintypes.HANDLE
+user32.DeferWindowPos.argtypes = [wintypes.HANDLE, wintypes.HWND, wintypes.HWND,
+                                  ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT]
+user32.DeferWindowPos.restype = wintypes.HANDLE
+user32.EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+user32.EndDeferWindowPos.restype = wintypes.BOOL
+user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                wintypes.UINT]
+user32.SetWindowPos.restype = wintypes.BOOL
+user32.ShowWindowAsync.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.ShowWindowAsync.restype = wintypes.BOOL
+user32.GetTopWindow.argtypes = [wintypes.HWND]
+user32.GetTopWindow.restype = wintypes.HWND
+user32.GetWindow.argtypes = [wintypes.HWND, wintypes.UINT]
+user32.GetWindow.restype = wintypes.HWND
+user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+user32.GetAncestor.restype = wintypes.HWND
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+user32.GetWindowRect.restype = wintypes.BOOL
+if dwmapi:
+    dwmapi.DwmGetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+    dwmapi.DwmGetWindowAttribute.restype = ctypes.c_long
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype = wintypes.BOOL
+kernel32.QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+                                                ctypes.POINTER(wintypes.DWORD)]
+kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+ntdll.NtQuerySystemInformation.argtypes = [wintypes.ULONG, ctypes.c_void_p, wintypes.ULONG,
+                                           ctypes.POINTER(wintypes.ULONG)]
+ntdll.NtQuerySystemInformation.restype = ctypes.c_long
+ntdll.NtQueryInformationProcess.argtypes = [wintypes.HANDLE, wintypes.ULONG, ctypes.c_void_p, wintypes.ULONG,
+                                            ctypes.POINTER(wintypes.ULONG)]
+ntdll.NtQueryInformationProcess.restype = ctypes.c_long
+
+# Window procedure hook for shell notifications
+LRESULT = wintypes.LPARAM
+WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+# 32-bit user32 only exports the non-Ptr name
+SetWindowLongPtrW = getattr(user32, "SetWindowLongPtrW", None) or user32.SetWindowLongW
+SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_void_p]
+SetWindowLongPtrW.restype = ctypes.c_void_p
+user32.CallWindowProcW.argtypes = [ctypes.c_void_p, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.CallWindowProcW.restype = LRESULT
+user32.RegisterWindowMessageW.argtypes = [wintypes.LPCWSTR]
+user32.RegisterWindowMessageW.restype = wintypes.UINT
+user32.RegisterShellHookWindow.argtypes = [wintypes.HWND]
+user32.RegisterShellHookWindow.restype = wintypes.BOOL
+user32.DeregisterShellHookWindow.argtypes = [wintypes.HWND]
+user32.DeregisterShellHookWindow.restype = wintypes.BOOL
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+class _INPUT_UNION(ctypes.Union):
+    # MOUSEINPUT is the largest member, so it sets sizeof(INPUT)
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUT_UNION)]
+
+user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+user32.SendInput.restype = wintypes.UINT
+
+# Title patterns used on every window during a scan
+_DC_RE = re.compile(r'DC\d+')
+_IS_ML_RE = re.compile(r'--proxy|DC|Profile|Mimic')
+_DEVTOOLS_PORT_RE = re.compile(r'--remote-debugging-port=(\d+)')
+
+# DevTools is always on localhost - never route it through a system proxy
+_LOCAL_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+# Scratch buffers reused for every window/process instead of allocating
+# per call (sized for long page titles and long-path exe locations)
+_TITLE_BUF = ctypes.create_unicode_buffer(2048)
+_PATH_BUF = ctypes.create_unicode_buffer(520)
+
+class UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ("Length", wintypes.USHORT),
+        ("MaximumLength", wintypes.USHORT),
+        ("Buffer", ctypes.c_void_p),
+    ]
+
+class SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    # Only the leading fields we read; entries are variable length and
+    # chained by NextEntryOffset.
+    _fields_ = [
+        ("NextEntryOffset", wintypes.ULONG),
+        ("NumberOfThreads", wintypes.ULONG),
+        ("Reserved1", ctypes.c_byte * 48),
+        ("ImageName", UNICODE_STRING),
+        ("BasePriority", ctypes.c_long),
+        ("UniqueProcessId", ctypes.c_void_p),
+    ]
+
+def _snapshot_pid_to_exe():
+    """Get {pid: image name} for every running process in one syscall"""
+    size = 0x40000
+    ret = wintypes.ULONG()
+    while True:
+        buf = ctypes.create_string_buffer(size)
+        status = ntdll.NtQuerySystemInformation(
+            SystemProcessInformation, buf, size, ctypes.byref(ret)) & 0xFFFFFFFF
+        if status != STATUS_INFO_LENGTH_MISMATCH:
+            break
+        # Process list grew between calls - retry with some headroom
+        size = max(size * 2, ret.value + 0x10000)
+    if status != 0:
+        return {}
+
+    pid_to_exe = {}
+    offset = 0
+    while True:
+        entry = SYSTEM_PROCESS_INFORMATION.from_buffer(buf, offset)
+        name = entry.ImageName
+        if name.Buffer:
+            pid_to_exe[entry.UniqueProcessId or 0] = ctypes.wstring_at(name.Buffer, name.Length // 2)
+        if not entry.NextEntryOffset:
+            break
+        offset += entry.NextEntryOffset
+    return pid_to_exe
+
+def _query_exe_path(pid):
+    """Get the image path of a single process, or "" if it can't be opened"""
+    # Limited query access is enough for QueryFullProcessImageNameW and is
+    # granted for far more processes than QUERY_INFORMATION | VM_READ
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ""
+    try:
+        size = wintypes.DWORD(len(_PATH_BUF))
+        if kernel32.QueryFullProcessImageNameW(handle, 0, _PATH_BUF, ctypes.byref(size)):
+            return _PATH_BUF.value
+        return ""
+    finally:
+        kernel32.CloseHandle(handle)
+
+def _query_command_line(pid):
+    """Get the command line of a single process, or "" if it can't be read"""
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ""
+    try:
+        # First call just reports the size needed
+        size = wintypes.ULONG()
+        ntdll.NtQueryInformationProcess(handle, ProcessCommandLineInformation, None, 0, ctypes.byref(size))
+        if not size.value:
+            return ""
+        buf = ctypes.create_string_buffer(size.value)
+        if ntdll.NtQueryInformationProcess(handle, ProcessCommandLineInformation, buf, size.value,
+                                           ctypes.byref(size)) != 0:
+            return ""
+        cmd = UNICODE_STRING.from_buffer(buf)
+        return ctypes.wstring_at(cmd.Buffer, cmd.Length // 2) if cmd.Buffer else ""
+    finally:
+        kernel32.CloseHandle(handle)
+
+def devtools_open_tab(port, url):
+    """Open url in a new tab through a browser's DevTools HTTP endpoint"""
+    # The whole query string is the target URL; the browser unescapes it
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/json/new?{urllib.parse.quote(url, safe='')}", method="PUT")
+    try:
+        with _LOCAL_OPENER.open(request, timeout=2) as response:
+            return response.status == 200
+    except:
+        return False
+
+def read_window(hwnd):
+    """Get (pid, title) of a visible window with a title, else None"""
+    if not user32.IsWindowVisible(hwnd):
+        return None
+    # Owned popups (tooltips, menus, IME candidates, dialogs) are never a
+    # browser window
+    if user32.GetAncestor(hwnd, GA_ROOTOWNER) != hwnd:
+        return None
+    # GetWindowTextW returns the copied length, so no separate length query
+    if user32.GetWindowTextW(hwnd, _TITLE_BUF, len(_TITLE_BUF)) <= 0:
+        return None
+
+    rect = wintypes.RECT()
+    if not user32.GetWindowRect(hwnd, ctypes.byref(rect)) or \
+            rect.right <= rect.left or rect.bottom <= rect.top:
+        return None
+    if dwmapi:
+        # Suspended UWP frames and the like are "visible" but cloaked; keep
+        # windows the shell cloaked, those are just on another desktop
+        cloaked = wintypes.DWORD()
+        if dwmapi.DwmGetWindowAttribute(hwnd, DWMWA_CLOAKED, ctypes.byref(cloaked),
+                                        ctypes.sizeof(cloaked)) == 0 and \
+                cloaked.value & ~DWM_CLOAKED_SHELL:
+            return None
+
+    pid = wintypes.DWORD()
+    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value, _TITLE_BUF.value
+
+class ProfileTable:
+    """Profile records stored column-wise, one container per field"""
+    __slots__ = ("hwnds", "pids", "titles", "names", "tabs")
+
+    def __init__(self):
+        self.hwnds = array('Q')
+        self.pids = array('I')
+        self.titles = []
+        self.names = []
+        self.tabs = []
+
+    def __len__(self):
+        return len(self.hwnds)
+
+    def append(self, hwnd, pid, title, name, tab):
+        self.hwnds.append(hwnd)
+        self.pids.append(pid)
+        self.titles.append(title)
+        self.names.append(name)
+        self.tabs.append(tab)
+
+    def replace(self, i, hwnd, pid, title, name, tab):
+        self.hwnds[i] = hwnd
+        self.pids[i] = pid
+        self.titles[i] = title
+        self.names[i] = name
+        self.tabs[i] = tab
+
+    def remove(self, i):
+        del self.hwnds[i]
+        del self.pids[i]
+        del self.titles[i]
+        del self.names[i]
+        del self.tabs[i]
+
+    def take(self, indices):
+        """New table with only the given rows, in the given order"""
+        table = ProfileTable()
+        for i in indices:
+            table.append(self.hwnds[i], self.pids[i], self.titles[i], self.names[i], self.tabs[i])
+        return table
+
+# Primary screen size, cleared on WM_DISPLAYCHANGE
+_SCREEN = [None]
 
 def get_screen_size():
     """Get screen width and height"""
-    return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+    if _SCREEN[0] is None:
+        _SCREEN[0] = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+    return _SCREEN[0]
+
+def show_windows(hwnds):
+    """Restore minimized/maximized windows and raise the rest in one batch"""
+    batch = []
+    for hwnd in hwnds:
+        # Windows closed since the last scan would fail the whole batch
+        if not user32.IsWindow(hwnd):
+            continue
+        if user32.IsIconic(hwnd) or user32.IsZoomed(hwnd):
+            # DeferWindowPos can't change the show state - post it instead
+            user32.ShowWindowAsync(hwnd, SW_RESTORE)
+        else:
+            batch.append(hwnd)
+    if not batch:
+        return
+
+    flags = SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE | SWP_SHOWWINDOW
+    hdwp = user32.BeginDeferWindowPos(len(batch))
+    for hwnd in batch:
+        if not hdwp:
+            break
+        hdwp = user32.DeferWindowPos(hdwp, hwnd, HWND_TOP, 0, 0, 0, 0, flags)
+    if hdwp:
+        user32.EndDeferWindowPos(hdwp)
+        return
+    # A failed DeferWindowPos discards the whole batch (e.g. UIPI refusing
+    # an elevated window) - raise each window on its own instead
+    for hwnd in batch:
+        user32.SetWindowPos(hwnd, HWND_TOP, 0, 0, 0, 0, flags)
+
+def minimize_windows(hwnds):
+    """Minimize windows without waiting on each one to respond"""
+    for hwnd in hwnds:
+        user32.ShowWindowAsync(hwnd, SW_MINIMIZE)
+
+def _key_input(vk=0, scan=0, flags=0):
+    return INPUT(INPUT_KEYBOARD, _INPUT_UNION(ki=KEYBDINPUT(vk, scan, flags, 0, 0)))
+
+def key_chord(*vks):
+    """Key events that press the keys in order and release them in reverse"""
+    return ([_key_input(vk) for vk in vks] +
+            [_key_input(vk, flags=KEYEVENTF_KEYUP) for vk in reversed(vks)])
+
+def text_inputs(text):
+    """Key events that type text as unicode characters"""
+    inputs = []
+    # One event pair per UTF-16 code unit, so surrogate pairs go through too
+    for unit in array('H', text.encode('utf-16-le')):
+        inputs.append(_key_input(scan=unit, flags=KEYEVENTF_UNICODE))
+        inputs.append(_key_input(scan=unit, flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return inputs
+
+def send_input(inputs):
+    """Inject a sequence of input events with a single SendInput call"""
+    events = (INPUT * len(inputs))(*inputs)
+    return user32.SendInput(len(inputs), events, ctypes.sizeof(INPUT))
 
 def resize_window_33(hwnd, index=0):
     """Resize window to 33% of screen width and position it"""
@@ -66,27 +452,77 @@ class MultiloginWindowManager:
         self.root.resizable(True, True)
 
         # Profile data
-        self.profiles = []
-        self.selected_index = None
+        self.profiles = ProfileTable()
+        self._hwnd_to_idx = {}
+        # Selection follows the window, not its row, across refreshes
+        self.selected_hwnd = None
 
-        # Checkbox states
+        # Checkbox states keyed by hwnd (in the order profiles first appeared)
         self.checkbox_vars = {}
+        self._checked_hwnds = set()
+
+        # Recycled row widgets for the profiles in view, and the hwnd each
+        # one is currently showing
+        self._row_pool = []
+        self._slot_hwnds = []
+        self._slot_shown = []
+        self._row_h = 0
+        self._list_height = None
+        self._wheel_delta = 0
+        self._wheel_pending = False
+
+        # pid -> exe_name for processes already looked up; a browser's new
+        # windows and tabs then cost no process query at all
+        self._pid_exe_cache = {}
+
+        # pid -> DevTools port from the browser's command line (0 = none)
+        self._devtools_ports = {}
+
+        # Set while an Apply URL run is driving the browsers
+        self._url_run_active = False
+
+        # title -> (profile, tab) so unchanged titles aren't parsed again
+        self._title_cache = {}
+
+        # Screenshots folder next to the exe/script, created on first use
+        self._screenshots_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Screenshots")
+        self._screenshots_dir_ready = False
+        self._screenshot_saving = False
 
         # Create UI
         self.create_ui()
-
-        # Start refresh thread
-        self.running = True
-        self.refresh_thread = threading.Thread(target=self.auto_refresh, daemon=True)
-        self.refresh_thread.start()
+        self.row_height()  # measure list rows once, before anything scrolls
 
         # Initial refresh
         self.refresh_profiles()
 
+        # From here on window scans run on a worker thread, which is then the
+        # only user of the shared ctypes buffers and the lookup caches
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._worker, daemon=True).start()
+
+        # React to windows opening/closing as it happens, between refreshes
+        self.install_shell_hook()
+
         # Bind hotkeys
         self.setup_hotkeys()
 
+        # Start refresh timer (paused while the window is minimized)
+        self._after_id = None
+        self._stale = False
+        self._refresh_pending = False
+        self._backoff = 1  # interval multiplier, doubles while nothing changes
+        self.root.bind("<Map>", self.on_map)
+        self._schedule_refresh()
+
     def create_ui(self):
+        # Named label styles - one font per style instead of one per widget
+        style = ttk.Style(self.root)
+        style.configure('Bold.TLabel', font=("", 9, "bold"))
+        style.configure('Heading.TLabel', font=("", 10, "bold"))
+        style.configure('Title.TLabel', font=("", 12, "bold"))
+        style.configure('List.TCheckbutton', background="white")
+
         # Top frame with tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -135,7 +571,7 @@ class MultiloginWindowManager:
         # Single profile buttons
         ttk.Button(btn_frame, text="Show", width=10, command=self.show_checked).pack(pady=2)
         ttk.Button(btn_frame, text="Minimize", width=10, command=self.minimize_checked).pack(pady=2)
-        ttk.Button(btn_frame, text="RefreshAll", width=10, command=self.refresh_profiles).pack(pady=2)
+        ttk.Button(btn_frame, text="RefreshAll", width=10, command=self._request_refresh).pack(pady=2)
         ttk.Button(btn_frame, text="Close", width=10, command=self.close_checked).pack(pady=2)
 
         ttk.Separator(btn_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
@@ -163,31 +599,33 @@ class MultiloginWindowManager:
         # Column headers with profile count
         header_frame = ttk.Frame(list_frame)
         header_frame.pack(fill=tk.X)
-        self.profile_count_label = ttk.Label(header_frame, text="Profile (0)", width=15, anchor=tk.W, font=("", 9, "bold"))
+        self.profile_count_label = ttk.Label(header_frame, text="Profile (0)", width=15, anchor=tk.W, style='Bold.TLabel')
         self.profile_count_label.pack(side=tk.LEFT, padx=(20, 5))
-        ttk.Label(header_frame, text="Tab", anchor=tk.W, font=("", 9, "bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(header_frame, text="Tab", anchor=tk.W, style='Bold.TLabel').pack(side=tk.LEFT, padx=5)
 
         # Scrollable list
         list_container = ttk.Frame(list_frame)
         list_container.pack(fill=tk.BOTH, expand=True)
 
         self.canvas = tk.Canvas(list_container, highlightthickness=0, bg="white")
-        scrollbar_y = ttk.Scrollbar(list_container, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.scrollbar_y = ttk.Scrollbar(list_container, orient=tk.VERTICAL, command=self.canvas.yview)
         scrollbar_x = ttk.Scrollbar(list_container, orient=tk.HORIZONTAL, command=self.canvas.xview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        self.canvas.configure(yscrollcommand=self.on_list_scroll, xscrollcommand=scrollbar_x.set)
 
+        # Rows are drawn straight onto the canvas - text items for the
+        # columns and an embedded checkbutton - so clicks are mapped to a row
+        # by their y position
         self.canvas.bind('<Configure>', self.on_canvas_configure)
-        self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
-
-        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.bind("<Button-1>", self.on_list_click)
+        self.canvas.bind("<Double-1>", self.on_list_double_click)
+        self.canvas.tag_bind("name", "<Enter>", lambda e: self.canvas.configure(cursor="hand2"))
+        self.canvas.tag_bind("name", "<Leave>", lambda e: self.canvas.configure(cursor=""))
+        # Only take over the mouse wheel while the pointer is over the list
+        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self.on_mousewheel))
+        self.canvas.bind("<Leave>", self.on_list_leave)
+        self.canvas.bind("<Destroy>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
+
+        self.scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -199,7 +637,8 @@ class MultiloginWindowManager:
         self.url_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         self.url_entry.insert(0, "https://")
 
-        ttk.Button(url_row, text="Apply", width=8, command=self.open_url_checked).pack(side=tk.RIGHT)
+        self.apply_button = ttk.Button(url_row, text="Apply", width=8, command=self.open_url_checked)
+        self.apply_button.pack(side=tk.RIGHT)
 
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -210,7 +649,7 @@ class MultiloginWindowManager:
         settings_content = ttk.Frame(self.settings_frame)
         settings_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        ttk.Label(settings_content, text="Hotkey Settings:", font=("", 10, "bold")).pack(anchor=tk.W, pady=5)
+        ttk.Label(settings_content, text="Hotkey Settings:", style='Heading.TLabel').pack(anchor=tk.W, pady=5)
         ttk.Label(settings_content, text="Ctrl+Shift+Left: Previous profile").pack(anchor=tk.W)
         ttk.Label(settings_content, text="Ctrl+Shift+Right: Next profile").pack(anchor=tk.W)
         ttk.Label(settings_content, text="Ctrl+Shift+Up: Show current profile").pack(anchor=tk.W)
@@ -227,7 +666,7 @@ class MultiloginWindowManager:
         about_content = ttk.Frame(self.about_frame)
         about_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        ttk.Label(about_content, text="Multilogin Window Manager v1.2", font=("", 12, "bold")).pack(pady=10)
+        ttk.Label(about_content, text="Multilogin Window Manager v1.2", style='Title.TLabel').pack(pady=10)
         ttk.Label(about_content, text="Manage your Multilogin X browser profiles easily.").pack()
         ttk.Label(about_content, text="").pack()
         ttk.Label(about_content, text="Features:").pack(anchor=tk.W)
@@ -238,10 +677,32 @@ class MultiloginWindowManager:
         ttk.Label(about_content, text="- Hotkeys support").pack(anchor=tk.W)
 
     def on_canvas_configure(self, event):
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        self.render_rows()
+
+    def on_list_scroll(self, first, last):
+        self.scrollbar_y.set(first, last)
+        self.render_rows()
+
+    def on_list_leave(self, event):
+        # Leave also fires when the pointer moves onto a row inside the list
+        widget = self.canvas.winfo_containing(event.x_root, event.y_root)
+        if widget is None or not str(widget).startswith(str(self.canvas)):
+            self.canvas.unbind_all("<MouseWheel>")
 
     def on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Coalesce a burst of wheel events into one scroll per idle cycle
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.root.after_idle(self._flush_scroll)
+        self._wheel_delta += event.delta
+
+    def _flush_scroll(self):
+        self._wheel_pending = False
+        # Keep the remainder so fine-grained wheels still add up to a step
+        steps = int(-self._wheel_delta / 120)
+        self._wheel_delta += steps * 120
+        if steps:
+            self.canvas.yview_scroll(steps, "units")
 
     def setup_hotkeys(self):
         self.root.bind("<Control-Shift-Left>", lambda e: self.nav_prev())
@@ -256,171 +717,452 @@ class MultiloginWindowManager:
         self.hotkeys_var.set(not self.hotkeys_var.get())
 
     def get_multilogin_windows(self):
-        windows = []
-
-        def enum_callback(hwnd, _):
-            if user32.IsWindowVisible(hwnd):
-                length = user32.GetWindowTextLengthW(hwnd)
-                if length > 0:
-                    buff = ctypes.create_unicode_buffer(length + 1)
-                    user32.GetWindowTextW(hwnd, buff, length + 1)
-                    title = buff.value
-
-                    pid = wintypes.DWORD()
-                    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-
-                    try:
-                        handle = kernel32.OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, False, pid.value)
-                        if handle:
-                            exe_path = ctypes.create_unicode_buffer(260)
-                            psapi.GetModuleFileNameExW(handle, None, exe_path, 260)
-                            kernel32.CloseHandle(handle)
-                            exe_name = exe_path.value.split("\\")[-1].lower()
-
-                            if "mimic" in exe_name or ("chrome" in exe_name and self.is_multilogin_profile(title)):
-                                profile_name = self.extract_profile_name(title)
-                                tab_title = self.extract_tab_title(title)
-
-                                windows.append({
-                                    "hwnd": hwnd,
-                                    "title": title,
-                                    "profile": profile_name,
-                                    "tab": tab_title,
-                                    "pid": pid.value
-                                })
-                    except:
-                        pass
-            return True
-
-        EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
-        user32.EnumWindows(EnumWindowsProc(enum_callback), 0)
+        # Walk the top-level windows in Z-order ourselves rather than have
+        # EnumWindows call back into Python for every one of them
+        found = []
+        visited = set()
+        hwnd = user32.GetTopWindow(None)
+        while hwnd and hwnd not in visited:
+            # visited guards against the chain looping while windows are
+            # being created/destroyed mid-walk
+            visited.add(hwnd)
+            info = read_window(hwnd)
+            if info:
+                found.append((hwnd,) + info)
+            hwnd = user32.GetWindow(hwnd, GW_HWNDNEXT)
+
+        # Forget processes with no visible window left, so a recycled PID
+        # gets looked up again
+        pids = {pid for _, pid, _ in found}
+        for pid in self._pid_exe_cache.keys() - pids:
+            del self._pid_exe_cache[pid]
+        for pid in self._devtools_ports.keys() - pids:
+            del self._devtools_ports[pid]
+
+        # Only new processes need the process snapshot
+        snapshot = None
+        if not pids <= self._pid_exe_cache.keys():
+            snapshot = _snapshot_pid_to_exe()
+
+        windows = ProfileTable()
+        for hwnd, pid, title in found:
+            record = self.classify_window(hwnd, pid, title, snapshot)
+            if record:
+                windows.append(*record)
+
+        # Titles that weren't seen this pass are unlikely to come back as-is
+        self._title_cache = {t: self._title_cache[t] for t in windows.titles if t in self._title_cache}
 
         # Deduplicate by PID - keep only one window per browser profile
         seen_pids = {}
         unique_windows = []
-        for w in windows:
-            pid = w["pid"]
+        titles = windows.titles
+        for i, pid in enumerate(windows.pids):
             if pid not in seen_pids:
-                seen_pids[pid] = w
-                unique_windows.append(w)
+                # Remember the slot in unique_windows, not the row
+                seen_pids[pid] = len(unique_windows)
+                unique_windows.append(i)
             else:
                 # Keep the window with the more informative title (longer usually means actual page)
-                if len(w["title"]) > len(seen_pids[pid]["title"]):
+                idx = seen_pids[pid]
+                if len(titles[i]) > len(titles[unique_windows[idx]]):
                     # Replace with better window
-                    idx = unique_windows.index(seen_pids[pid])
-                    unique_windows[idx] = w
-                    seen_pids[pid] = w
-
-        return unique_windows
+                    unique_windows[idx] = i
+
+        return windows.take(unique_windows)
+
+    def classify_window(self, hwnd, pid, title, snapshot=None):
+        """Get (hwnd, pid, title, profile, tab) for a Multilogin window, else None"""
+        exe_name = self._pid_exe_cache.get(pid)
+        if exe_name is None:
+            # Fall back to asking the process directly if it started after
+            # the snapshot (or the snapshot failed / wasn't taken)
+            exe_path = (snapshot and snapshot.get(pid)) or _query_exe_path(pid)
+            exe_name = exe_path.rsplit("\\", 1)[-1].lower()
+            self._pid_exe_cache[pid] = exe_name
+
+        try:
+            if "mimic" in exe_name or ("chrome" in exe_name and self.is_multilogin_profile(title)):
+                return (hwnd, pid, title) + self.parse_title(title)
+        except:
+            pass
+        return None
+
+    def probe_window(self, hwnd):
+        """Classify a single window outside of a full scan"""
+        info = read_window(hwnd)
+        if info:
+            return self.classify_window(hwnd, *info)
+        return None
 
     def is_multilogin_profile(self, title):
-        indicators = ["--proxy", "DC", "Profile", "Mimic"]
-        return any(ind in title for ind in indicators)
-
-    def extract_profile_name(self, title):
-        match = re.search(r'(DC\d+)', title)
-        if match:
-            return match.group(1)
+        return _IS_ML_RE.search(title) is not None
 
-        if " - " in title:
-            parts = title.split(" - ")
-            if len(parts) >= 2:
-                return parts[0][:18] + ".." if len(parts[0]) > 18 else parts[0]
+    def parse_title(self, title):
+        """Get the (profile, tab) display strings for a window title"""
+        cached = self._title_cache.get(title)
+        if cached is not None:
+            return cached
+        if len(self._title_cache) >= TITLE_CACHE_SIZE:
+            self._title_cache.clear()
 
-        for sep in [" --", " |", " —"]:
-            if sep in title:
-                return title.split(sep)[0][:18]
+        # Browser titles are usually: "Page Title - Browser Name"
+        # Only the first two parts are ever used, so split at most twice
+        parts = title.split(" - ", 2)
 
-        return title[:18] + ".." if len(title) > 18 else title
+        match = _DC_RE.search(title)
+        if match:
+            profile = match.group(0)
+        elif len(parts) > 1:
+            profile = parts[0][:18] + ".." if len(parts[0]) > 18 else parts[0]
+        else:
+            for sep in (" --", " |", " —"):
+                if sep in title:
+                    profile = title.split(sep, 1)[0][:18]
+                    break
+            else:
+                profile = title[:18] + ".." if len(title) > 18 else title
 
-    def extract_tab_title(self, title):
-        # Browser titles are usually: "Page Title - Browser Name"
-        # We want the page title (first part before " - ")
-        if " - " in title:
-            parts = title.split(" - ")
+        if len(parts) > 1:
             # First part is usually the page/website title
             tab = parts[0].strip()
             # If first part looks like a profile name (DC##), try second part
-            if tab.startswith("DC") and tab[2:].split()[0].isdigit() and len(parts) > 1:
+            words = tab[2:].split()
+            if tab.startswith("DC") and words and words[0].isdigit():
                 tab = parts[1].strip()
-            return tab[:20] + ".." if len(tab) > 20 else tab
+        else:
+            tab = title
+        tab = tab[:20] + ".." if len(tab) > 20 else tab
 
-        return title[:20] + ".." if len(title) > 20 else title
+        self._title_cache[title] = profile, tab
+        return profile, tab
 
     def refresh_profiles(self):
-        old_states = {}
-        for i, var in self.checkbox_vars.items():
-            if i < len(self.profiles):
-                old_states[self.profiles[i]["title"]] = var.get()
-
-        self.profiles = self.get_multilogin_windows()
-
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        self.checkbox_vars = {}
-
-        for i, profile in enumerate(self.profiles):
-            row_frame = ttk.Frame(self.scrollable_frame)
-            row_frame.pack(fill=tk.X, pady=1)
-
-            var = tk.BooleanVar(value=old_states.get(profile["title"], False))
-            self.checkbox_vars[i] = var
-            cb = ttk.Checkbutton(row_frame, variable=var)
-            cb.pack(side=tk.LEFT, padx=2)
-
-            profile_label = ttk.Label(row_frame, text=profile["profile"], width=15, anchor=tk.W, cursor="hand2")
-            profile_label.pack(side=tk.LEFT, padx=2)
-            profile_label.bind("<Button-1>", lambda e, idx=i: self.on_profile_click(idx))
-            profile_label.bind("<Double-1>", lambda e, idx=i: self.show_profile(idx))
-
-            tab_label = ttk.Label(row_frame, text=profile["tab"], anchor=tk.W)
-            tab_label.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
-            tab_label.bind("<Button-1>", lambda e, idx=i: self.on_profile_click(idx))
-            tab_label.bind("<Double-1>", lambda e, idx=i: self.show_profile(idx))
-
-        # Update profile count in header
-        self.profile_count_label.config(text=f"Profile ({len(self.profiles)})")
-        self.status_var.set("Ready")
-
-    def on_profile_click(self, index):
-        if index in self.checkbox_vars:
-            self.checkbox_vars[index].set(not self.checkbox_vars[index].get())
-        self.selected_index = index
+        self.apply_profiles(self.get_multilogin_windows())
+
+    def apply_profiles(self, profiles):
+        # Keep rows in the order they first appeared so the list doesn't
+        # reshuffle every time the window Z-order changes
+        order = {hwnd: i for i, hwnd in enumerate(self.checkbox_vars)}
+        hwnds = profiles.hwnds
+        profiles = profiles.take(sorted(range(len(profiles)), key=lambda i: order.get(hwnds[i], len(order))))
+        self.profiles = profiles
+        self._hwnd_to_idx = {hwnd: i for i, hwnd in enumerate(profiles.hwnds)}
+
+        # Checkbox state lives per hwnd, independent of the row widgets
+        for hwnd in self.checkbox_vars.keys() - set(profiles.hwnds):
+            del self.checkbox_vars[hwnd]
+            self._checked_hwnds.discard(hwnd)
+        for hwnd in profiles.hwnds:
+            if hwnd not in self.checkbox_vars:
+                self.checkbox_vars[hwnd] = tk.BooleanVar(value=False)
+
+        # The scroll region covers the whole list, but only the rows in view
+        # get canvas items
+        height = len(profiles) * self.row_height()
+        if height != self._list_height:
+            self._list_height = height
+            self.canvas.configure(scrollregion=(0, 0, 0, height))
+            # Update profile count in header
+            self.profile_count_label.config(text=f"Profile ({len(profiles)})")
+        self.render_rows()
+
+    def _new_row(self):
+        slot = len(self._row_pool)
+        canvas = self.canvas
+        tag = f"slot{slot}"
+
+        cb = ttk.Checkbutton(canvas, style='List.TCheckbutton', command=lambda: self.on_slot_check(slot))
+        cb_item = canvas.create_window(0, 0, window=cb, anchor=tk.W, state=tk.HIDDEN, tags=tag)
+        name_item = canvas.create_text(0, 0, anchor=tk.W, font="TkDefaultFont", state=tk.HIDDEN,
+                                       tags=(tag, "name"))
+        tab_item = canvas.create_text(0, 0, anchor=tk.W, font="TkDefaultFont", state=tk.HIDDEN, tags=tag)
+
+        self._row_pool.append((cb, cb_item, name_item, tab_item))
+        self._slot_hwnds.append(None)
+        self._slot_shown.append(None)
+
+    def row_height(self):
+        if not self._row_h:
+            if not self._row_pool:
+                self._new_row()
+            cb = self._row_pool[0][0]
+            cb.update_idletasks()
+            # Same column layout the packed labels had: the profile column
+            # is 15 characters wide
+            font = tkfont.nametofont("TkDefaultFont")
+            self._name_x = 2 + cb.winfo_reqwidth() + 4
+            self._tab_x = self._name_x + font.measure("0") * 15 + 4
+            self._row_h = max(cb.winfo_reqheight(), font.metrics("linespace")) + 2  # 1px gap above and below
+        return self._row_h
+
+    def render_rows(self):
+        """Point the pooled row items at the profiles currently in view"""
+        profiles = self.profiles
+        canvas = self.canvas
+        row_h = self.row_height()
+        first = max(int(canvas.canvasy(0) // row_h), 0)
+        last = min(first + canvas.winfo_height() // row_h + 2, len(profiles))
+        count = max(last - first, 0)
+
+        while len(self._row_pool) < count:
+            self._new_row()
+
+        for slot, i in enumerate(range(first, last)):
+            hwnd = profiles.hwnds[i]
+            shown = (hwnd, profiles.names[i], profiles.tabs[i], i)
+            old = self._slot_shown[slot]
+            if shown == old:
+                continue
+            # Only touch what changed - most refreshes change nothing
+            cb, cb_item, name_item, tab_item = self._row_pool[slot]
+            if old is None:
+                canvas.itemconfigure(f"slot{slot}", state=tk.NORMAL)
+                old = (None, None, None, None)
+            if hwnd != old[0]:
+                cb.configure(variable=self.checkbox_vars[hwnd])
+            if shown[1] != old[1]:
+                canvas.itemconfigure(name_item, text=shown[1])
+            if shown[2] != old[2]:
+                canvas.itemconfigure(tab_item, text=shown[2])
+            if i != old[3]:
+                y = i * row_h + row_h // 2
+                canvas.coords(cb_item, 2, y)
+                canvas.coords(name_item, self._name_x, y)
+                canvas.coords(tab_item, self._tab_x, y)
+            self._slot_hwnds[slot] = hwnd
+            self._slot_shown[slot] = shown
+
+        for slot in range(count, len(self._row_pool)):
+            if self._slot_shown[slot] is not None:
+                canvas.itemconfigure(f"slot{slot}", state=tk.HIDDEN)
+                self._slot_hwnds[slot] = None
+                self._slot_shown[slot] = None
+
+    def on_slot_check(self, slot):
+        hwnd = self._slot_hwnds[slot]
+        if hwnd is not None:
+            self._set_checked(hwnd, self.checkbox_vars[hwnd].get())
+
+    def _set_checked(self, hwnd, checked):
+        if checked:
+            self._checked_hwnds.add(hwnd)
+        else:
+            self._checked_hwnds.discard(hwnd)
+
+    def row_at(self, y):
+        """Index of the profile under canvas window coordinate y, else None"""
+        i = int(self.canvas.canvasy(y) // self.row_height())
+        return i if 0 <= i < len(self.profiles) else None
+
+    def on_list_click(self, event):
+        i = self.row_at(event.y)
+        if i is not None:
+            self.on_profile_click(self.profiles.hwnds[i])
+
+    def on_list_double_click(self, event):
+        i = self.row_at(event.y)
+        if i is not None:
+            self.show_profile(i)
+
+    def _incremental_add(self, hwnd, record):
+        """Add, update or drop one window after a shell notification"""
+        profiles = self.profiles
+        index = self.profile_index(hwnd)
+        if record is None:
+            if index is None:
+                return
+            profiles.remove(index)
+        elif index is not None:
+            if profiles.titles[index] == record[2]:
+                return
+            profiles.replace(index, *record)
+        else:
+            # Same dedup rule as a full scan - one window per browser pid
+            try:
+                other = profiles.pids.index(record[1])
+            except ValueError:
+                profiles.append(*record)
+            else:
+                if len(record[2]) <= len(profiles.titles[other]):
+                    return
+                profiles.replace(other, *record)
+        self._reset_backoff()
+        self.apply_profiles(profiles)
+
+    def _incremental_remove(self, hwnd):
+        index = self.profile_index(hwnd)
+        if index is not None:
+            self.profiles.remove(index)
+            self._reset_backoff()
+            self.apply_profiles(self.profiles)
+
+    def install_shell_hook(self):
+        """Have the shell notify us when top-level windows open, close or retitle"""
+        self.root.update_idletasks()
+        self._hook_hwnd = int(self.root.wm_frame(), 16)
+        self._shell_msg = user32.RegisterWindowMessageW("SHELLHOOK")
+
+        # Subclass the Tk frame window; the thunk must stay referenced for as
+        # long as it is installed
+        self._wndproc = WNDPROC(self._shell_wndproc)
+        self._old_wndproc = SetWindowLongPtrW(self._hook_hwnd, GWLP_WNDPROC,
+                                              ctypes.cast(self._wndproc, ctypes.c_void_p))
+        # Without the subclass nobody would see the messages - just keep polling
+        self._shell_hooked = bool(self._old_wndproc) and bool(user32.RegisterShellHookWindow(self._hook_hwnd))
+
+    def remove_shell_hook(self):
+        if self._shell_hooked:
+            user32.DeregisterShellHookWindow(self._hook_hwnd)
+            self._shell_hooked = False
+        if self._old_wndproc:
+            SetWindowLongPtrW(self._hook_hwnd, GWLP_WNDPROC, self._old_wndproc)
+            self._old_wndproc = None
+
+    def _shell_wndproc(self, hwnd, msg, wparam, lparam):
+        if msg == self._shell_msg:
+            code = wparam & 0x7FFF
+            # Removals go through the worker too, so they can't overtake a
+            # probe of the same window that is still in flight
+            if code in (HSHELL_WINDOWCREATED, HSHELL_REDRAW):
+                self._jobs.put((self._probe_job, (lparam,)))
+            elif code == HSHELL_WINDOWDESTROYED:
+                self._jobs.put((self._post, (self._incremental_remove, lparam)))
+            return 0
+        if msg == WM_DISPLAYCHANGE:
+            _SCREEN[0] = None
+        return user32.CallWindowProcW(self._old_wndproc, hwnd, msg, wparam, lparam)
+
+    def profile_index(self, hwnd):
+        return self._hwnd_to_idx.get(hwnd)
+
+    @property
+    def selected_index(self):
+        return self._hwnd_to_idx.get(self.selected_hwnd)
+
+    @selected_index.setter
+    def selected_index(self, index):
+        self.selected_hwnd = None if index is None else self.profiles.hwnds[index]
+
+    def on_profile_click(self, hwnd):
+        if hwnd in self.checkbox_vars:
+            checked = hwnd not in self._checked_hwnds
+            self.checkbox_vars[hwnd].set(checked)
+            self._set_checked(hwnd, checked)
+        self.selected_hwnd = hwnd
 
     def show_profile(self, index):
-        if index < len(self.profiles):
-            profile = self.profiles[index]
-            hwnd = profile["hwnd"]
+        if index is not None and index < len(self.profiles):
+            hwnd = self.profiles.hwnds[index]
             user32.ShowWindow(hwnd, SW_RESTORE)
             user32.SetForegroundWindow(hwnd)
-            self.status_var.set(f"Showing: {profile['profile']}")
+            self.status_var.set(f"Showing: {self.profiles.names[index]}")
+
+    def _interval_ms(self):
+        try:
+            interval = int(self.refresh_interval.get())
+        except:
+            interval = 3
+        interval = max(interval, 1)
+        return min(interval * self._backoff, max(interval, MAX_REFRESH_INTERVAL)) * 1000
+
+    def _schedule_refresh(self):
+        self._after_id = self.root.after(self._interval_ms(), self._tick)
+
+    def _tick(self):
+        if self.root.winfo_viewable():
+            self._request_refresh()
+        else:
+            # Nothing is visible while minimized - catch up when restored
+            self._stale = True
+        self._schedule_refresh()
+
+    def on_map(self, event):
+        if event.widget is self.root and self._stale:
+            self._stale = False
+            self._request_refresh()
+
+    def _request_refresh(self, delay=0):
+        """Schedule a refresh unless one is already on its way"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after(delay, self._do_refresh)
+
+    def _do_refresh(self):
+        self._jobs.put((self._scan_job, ()))
 
-    def auto_refresh(self):
-        while self.running:
+    def _finish_refresh(self, profiles):
+        self._refresh_pending = False
+        if profiles is None:
+            return
+        # Don't wipe progress messages of a URL run or a screenshot save
+        if not (self._url_run_active or self._screenshot_saving):
+            self.status_var.set("Ready")
+        # Poll less often while nothing changes and snap back to the
+        # configured interval as soon as something does
+        if self.window_signature(profiles) == self.window_signature(self.profiles):
+            self._backoff = min(self._backoff * 2, MAX_REFRESH_INTERVAL)
+            return
+        self._reset_backoff()
+        self.apply_profiles(profiles)
+
+    def _reset_backoff(self):
+        if self._backoff > 1:
+            self._backoff = 1
+            self.root.after_cancel(self._after_id)
+            self._schedule_refresh()
+
+    def window_signature(self, profiles):
+        return frozenset(zip(profiles.hwnds, profiles.titles))
+
+    def _worker(self):
+        """Run window scans and probes off the Tk thread, one at a time"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            func, args = job
             try:
-                interval = int(self.refresh_interval.get())
+                func(*args)
             except:
-                interval = 3
-            time.sleep(interval)
-            if self.running:
-                self.root.after(0, self.refresh_profiles)
+                pass
+
+    def _scan_job(self):
+        # Always report back, or _refresh_pending would never clear
+        try:
+            profiles = self.get_multilogin_windows()
+        except:
+            profiles = None
+        self._post(self._finish_refresh, profiles)
+
+    def _probe_job(self, hwnd):
+        self._post(self._incremental_add, hwnd, self.probe_window(hwnd))
+
+    def _post(self, func, *args):
+        """Hand a worker result to the Tk thread"""
+        try:
+            self.root.after(0, func, *args)
+        except:
+            pass  # main window already destroyed
 
     def get_checked_profiles(self):
-        checked = []
-        for i, var in self.checkbox_vars.items():
-            if var.get() and i < len(self.profiles):
-                checked.append(self.profiles[i])
-        return checked
+        """Indices into self.profiles of the ticked rows"""
+        # O(checked) via the hwnd -> row map, sorted back into list order
+        rows = self._hwnd_to_idx
+        return sorted(rows[hwnd] for hwnd in self._checked_hwnds if hwnd in rows)
 
     def select_all(self):
-        for var in self.checkbox_vars.values():
-            var.set(True)
+        for hwnd, var in self.checkbox_vars.items():
+            if hwnd not in self._checked_hwnds:
+                var.set(True)
+        self._checked_hwnds = set(self.checkbox_vars)
         self.status_var.set(f"Selected all {len(self.profiles)} profiles")
 
     def deselect_all(self):
-        for var in self.checkbox_vars.values():
-            var.set(False)
+        for hwnd in self._checked_hwnds:
+            self.checkbox_vars[hwnd].set(False)
+        self._checked_hwnds = set()
         self.status_var.set("Deselected all profiles")
 
     def take_screenshot(self):
@@ -429,11 +1171,14 @@ class MultiloginWindowManager:
             messagebox.showerror("Error", "PIL/Pillow not installed.\nRun: pip install Pillow")
             return
 
-        # Create Screenshots folder next to the exe/script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        screenshots_dir = os.path.join(script_dir, "Screenshots")
-        if not os.path.exists(screenshots_dir):
-            os.makedirs(screenshots_dir)
+        screenshots_dir = self._screenshots_dir
+        if not self._screenshots_dir_ready:
+            try:
+                os.makedirs(screenshots_dir, exist_ok=True)
+            except OSError as e:
+                self.status_var.set(f"Cannot create Screenshots folder: {e.strerror or e}")
+                return
+            self._screenshots_dir_ready = True
 
         # Get window position
         x = self.root.winfo_rootx()
@@ -441,16 +1186,34 @@ class MultiloginWindowManager:
         width = self.root.winfo_width()
         height = self.root.winfo_height()
 
-        # Capture screenshot
-        screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
+        # Capture screenshot - root coordinates are virtual-screen ones, so
+        # grab across all monitors or a window on a secondary one comes out
+        # blank. Pillow still captures the whole desktop and crops to bbox.
+        screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height), all_screens=True)
 
-        # Save with timestamp
+        # Save with timestamp; PNG encoding happens on the worker thread
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"MLM_Screenshot_{timestamp}.png"
         filepath = os.path.join(screenshots_dir, filename)
-        screenshot.save(filepath)
+        self.status_var.set(f"Saving: {filename}...")
+        self._screenshot_saving = True
+        self._jobs.put((self._save_screenshot, (screenshot, filepath, screenshots_dir)))
+
+    def _save_screenshot(self, screenshot, filepath, screenshots_dir):
+        try:
+            screenshot.save(filepath)
+        except:
+            self._post(self._screenshot_failed)
+            return
+        self._post(self._screenshot_saved, filepath, screenshots_dir)
+
+    def _screenshot_failed(self):
+        self._screenshot_saving = False
+        self.status_var.set("Could not save screenshot")
 
-        self.status_var.set(f"Saved: {filename}")
+    def _screenshot_saved(self, filepath, screenshots_dir):
+        self._screenshot_saving = False
+        self.status_var.set(f"Saved: {os.path.basename(filepath)}")
 
         # Open the Screenshots folder
         os.startfile(screenshots_dir)
@@ -460,10 +1223,10 @@ class MultiloginWindowManager:
         if not checked:
             self.status_var.set("No profiles selected")
             return
-        for profile in checked:
-            user32.ShowWindow(profile["hwnd"], SW_RESTORE)
-            user32.SetForegroundWindow(profile["hwnd"])
-            time.sleep(0.1)
+        hwnds = [self.profiles.hwnds[i] for i in checked]
+        show_windows(hwnds)
+        # Only the last one can end up in front, so focus just that one
+        user32.SetForegroundWindow(hwnds[-1])
         self.status_var.set(f"Showing {len(checked)} selected profiles")
 
     def minimize_checked(self):
@@ -471,8 +1234,8 @@ class MultiloginWindowManager:
         if not checked:
             self.status_var.set("No profiles selected")
             return
-        for profile in checked:
-            user32.ShowWindow(profile["hwnd"], SW_MINIMIZE)
+        hwnds = self.profiles.hwnds
+        minimize_windows([hwnds[i] for i in checked])
         self.status_var.set(f"Minimized {len(checked)} selected profiles")
 
     def close_checked(self):
@@ -480,30 +1243,65 @@ class MultiloginWindowManager:
         if not checked:
             self.status_var.set("No profiles selected")
             return
-        if messagebox.askyesno("Confirm", f"Close {len(checked)} selected profiles?"):
-            for profile in checked:
-                user32.PostMessageW(profile["hwnd"], WM_CLOSE, 0, 0)
-            self.status_var.set(f"Closing {len(checked)} profiles...")
-            self.root.after(1000, self.refresh_profiles)
+        # Capture the targets now - the list may refresh while the dialog is up
+        hwnds = [self.profiles.hwnds[i] for i in checked]
+        self.ask("Confirm", f"Close {len(hwnds)} selected profiles?",
+                 lambda: self.close_windows(hwnds, f"Closing {len(hwnds)} profiles..."))
 
     def show_all(self):
-        for profile in self.profiles:
-            user32.ShowWindow(profile["hwnd"], SW_RESTORE)
+        show_windows(self.profiles.hwnds)
         self.status_var.set(f"Showing all {len(self.profiles)} profiles")
 
     def minimize_all(self):
-        for profile in self.profiles:
-            user32.ShowWindow(profile["hwnd"], SW_MINIMIZE)
+        minimize_windows(self.profiles.hwnds)
         self.status_var.set(f"Minimized all {len(self.profiles)} profiles")
 
     def close_all(self):
-        if self.profiles and messagebox.askyesno("Confirm", f"Close all {len(self.profiles)} profiles?"):
-            for profile in self.profiles:
-                user32.PostMessageW(profile["hwnd"], WM_CLOSE, 0, 0)
-            self.status_var.set(f"Closing all profiles...")
-            self.root.after(1000, self.refresh_profiles)
+        if self.profiles:
+            hwnds = list(self.profiles.hwnds)
+            self.ask("Confirm", f"Close all {len(hwnds)} profiles?",
+                     lambda: self.close_windows(hwnds, "Closing all profiles..."))
+
+    def close_windows(self, hwnds, status):
+        for hwnd in hwnds:
+            user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+        self.status_var.set(status)
+        # The shell hook reports each window as it actually goes away; only
+        # fall back to a timed rescan when it isn't installed
+        if not self._shell_hooked:
+            # Bypass the coalescing latch - a scan already pending may have
+            # started before the windows handled WM_CLOSE
+            self._reset_backoff()
+            self.root.after(1000, self._do_refresh)
+
+    def ask(self, title, message, on_yes):
+        """Yes/No confirmation that calls on_yes() instead of blocking like askyesno"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        dialog.geometry(f"+{self.root.winfo_rootx() + 60}+{self.root.winfo_rooty() + 60}")
+
+        ttk.Label(dialog, text=message).pack(padx=20, pady=(15, 10))
+        buttons = ttk.Frame(dialog)
+        buttons.pack(pady=(0, 10))
+
+        def yes():
+            dialog.destroy()
+            on_yes()
+
+        ttk.Button(buttons, text="Yes", width=8, command=yes).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="No", width=8, command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        dialog.bind("<Return>", lambda e: yes())
+        dialog.bind("<Escape>", lambda e: dialog.destroy())
+
+        # Modal for input, but the main loop keeps running
+        dialog.grab_set()
+        dialog.focus_set()
 
     def open_url_checked(self):
+        if self._url_run_active:
+            return
         url = self.url_entry.get().strip()
         if not url or url == "https://":
             messagebox.showwarning("Warning", "Please enter a valid URL")
@@ -512,53 +1310,80 @@ class MultiloginWindowManager:
         if not url.startswith("http"):
             url = "https://" + url
 
+        profiles = self.profiles
         checked = self.get_checked_profiles()
         if not checked:
-            if messagebox.askyesno("No Selection", "No profiles selected. Apply to ALL profiles?"):
-                checked = self.profiles
-            else:
-                return
-
-        count = 0
-        for profile in checked:
-            hwnd = profile["hwnd"]
-            user32.ShowWindow(hwnd, SW_RESTORE)
-            user32.SetForegroundWindow(hwnd)
-            time.sleep(0.2)
-            self.send_url_to_window(hwnd, url)
-            count += 1
-            time.sleep(0.3)
-
-        self.status_var.set(f"Opened URL in {count} profiles")
+            targets = list(zip(profiles.hwnds, profiles.pids))
+            self.ask("No Selection", "No profiles selected. Apply to ALL profiles?",
+                     lambda: self.open_url_in(targets, url))
+            return
 
-    def send_url_to_window(self, hwnd, url):
-        VK_CONTROL = 0x11
-        VK_T = 0x54  # T key for new tab
-        VK_RETURN = 0x0D
-        VK_V = 0x56
+        self.open_url_in([(profiles.hwnds[i], profiles.pids[i]) for i in checked], url)
 
+    def open_url_in(self, targets, url):
+        """Open url in a new tab of each (hwnd, pid) profile"""
+        # One run at a time - two interleaved keystroke chains would type
+        # into each other's windows
+        if self._url_run_active:
+            return
+        self._url_run_active = True
+        self.apply_button.state(["disabled"])
+        self.status_var.set(f"Opening URL in {len(targets)} profiles...")
+        self._jobs.put((self._devtools_job, (targets, url)))
+
+    def _devtools_job(self, targets, url):
+        # Browsers started with a DevTools port get the tab over HTTP; only
+        # the rest need their keyboard driven
+        rest = []
+        for hwnd, pid in targets:
+            try:
+                opened = self._devtools_open(pid, url)
+            except:
+                opened = False
+            if not opened:
+                rest.append(hwnd)
+        self._post(self._open_url_step, rest, url, 0, len(targets) - len(rest), len(targets))
+
+    def _devtools_open(self, pid, url):
+        port = self._devtools_ports.get(pid)
+        if port is None:
+            match = _DEVTOOLS_PORT_RE.search(_query_command_line(pid))
+            port = self._devtools_ports[pid] = int(match.group(1)) if match else 0
+        return bool(port) and devtools_open_tab(port, url)
+
+    def _open_url_step(self, hwnds, url, i, done, total):
+        if i >= len(hwnds):
+            self._url_run_active = False
+            self.apply_button.state(["!disabled"])
+            if done < total:
+                self.status_var.set(f"Opened URL in {done} of {total} profiles (others lost focus)")
+            else:
+                self.status_var.set(f"Opened URL in {done} profiles")
+            return
+        # Send to one profile at a time from the Tk timer so the UI keeps
+        # redrawing while the browsers are being driven
+        user32.ShowWindowAsync(hwnds[i], SW_RESTORE)
+        user32.SetForegroundWindow(hwnds[i])
+        self.status_var.set(f"Opening URL in profile {total - len(hwnds) + i + 1}/{total}...")
+        self.root.after(200, self._send_url_step, hwnds, url, i, done, total)
+
+    def _send_url_step(self, hwnds, url, i, done, total):
+        # Keystrokes go to whatever has focus, so only send them while the
+        # profile is still in front; skip it if anything took focus
+        if user32.GetForegroundWindow() != hwnds[i]:
+            self._open_url_step(hwnds, url, i + 1, done, total)
+            return
         # Open new tab with Ctrl+T
-        user32.keybd_event(VK_CONTROL, 0, 0, 0)
-        user32.keybd_event(VK_T, 0, 0, 0)
-        user32.keybd_event(VK_T, 0, 2, 0)
-        user32.keybd_event(VK_CONTROL, 0, 2, 0)
-
-        time.sleep(0.15)
-
-        # Copy URL to clipboard and paste
-        self.root.clipboard_clear()
-        self.root.clipboard_append(url)
-
-        user32.keybd_event(VK_CONTROL, 0, 0, 0)
-        user32.keybd_event(VK_V, 0, 0, 0)
-        user32.keybd_event(VK_V, 0, 2, 0)
-        user32.keybd_event(VK_CONTROL, 0, 2, 0)
-
-        time.sleep(0.1)
+        send_input(key_chord(VK_CONTROL, VK_T))
+        self.root.after(NEW_TAB_DELAY_MS, self._type_url_step, hwnds, url, i, done, total)
 
-        # Press Enter to navigate
-        user32.keybd_event(VK_RETURN, 0, 0, 0)
-        user32.keybd_event(VK_RETURN, 0, 2, 0)
+    def _type_url_step(self, hwnds, url, i, done, total):
+        if user32.GetForegroundWindow() == hwnds[i]:
+            # Once the new tab has focus, type the URL straight in as unicode
+            # keystrokes (no clipboard) and press Enter - all in one batch
+            send_input(text_inputs(url) + key_chord(VK_RETURN))
+            done += 1
+        self.root.after(300, self._open_url_step, hwnds, url, i + 1, done, total)
 
     def show_current(self):
         if self.selected_index is not None and self.selected_index < len(self.profiles):
@@ -588,7 +1413,10 @@ class MultiloginWindowManager:
             self.show_profile(0)
 
     def on_close(self):
-        self.running = False
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+        self.remove_shell_hook()
+        self._jobs.put(None)
         self.root.destroy()
 
 